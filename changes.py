@@ -0,0 +1,176 @@
+RED = "\033[91m"
+RESET = "\033[0m"
+
+
+class ChangeEvent:
+    """
+    Describes a single change to a product in the store.
+
+    Attributes:
+        sequence (int): The position of the event in the change log.
+        product: The product that changed.
+        field (str): What changed: "quantity", "active", "promotion" or "listed".
+        old_value: The value before the change.
+        new_value: The value after the change.
+    """
+
+    def __init__(self, sequence: int, product, field: str, old_value, new_value):
+        """
+        Initializes a change event.
+
+        Args:
+            sequence (int): The position of the event in the change log.
+            product: The product that changed.
+            field (str): The name of the changed field.
+            old_value: The value before the change.
+            new_value: The value after the change.
+        """
+        self.sequence = sequence
+        self.product = product
+        self.field = field
+        self.old_value = old_value
+        self.new_value = new_value
+
+    def __str__(self):
+        """Returns a short description of the change."""
+        return f"#{self.sequence} {self.product.name}: {self.field} {self.old_value} -> {self.new_value}"
+
+
+class ChangeLog:
+    """
+    A bounded ring buffer of product change events.
+
+    Recording an event never blocks: once the buffer is full the oldest
+    event is overwritten, and subscribers that fall behind skip ahead.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initializes an empty change log.
+
+        Args:
+            capacity (int): The maximum number of events kept in the buffer.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"{RED}ATTENTION! Change log capacity must be positive.{RESET}")
+        self.capacity = capacity
+        self._buffer = [None] * capacity
+        self._next_sequence = 0
+
+    def record(self, product, field: str, old_value, new_value):
+        """
+        Appends a change event, overwriting the oldest one if the buffer is full.
+
+        Args:
+            product: The product that changed.
+            field (str): The name of the changed field.
+            old_value: The value before the change.
+            new_value: The value after the change.
+        """
+        sequence = self._next_sequence
+        self._buffer[sequence % self.capacity] = ChangeEvent(sequence, product, field,
+                                                             old_value, new_value)
+        self._next_sequence = sequence + 1
+
+    def oldest_sequence(self) -> int:
+        """Returns the sequence number of the oldest event still in the buffer."""
+        return max(0, self._next_sequence - self.capacity)
+
+    def next_sequence(self) -> int:
+        """Returns the sequence number the next recorded event will get."""
+        return self._next_sequence
+
+    def subscribe(self, from_start: bool = False):
+        """
+        Creates a subscriber with its own cursor into the log.
+
+        Args:
+            from_start (bool): If True, the subscriber starts at the oldest
+                               event still buffered instead of the newest.
+
+        Returns:
+            Subscriber: The new subscriber.
+        """
+        start = self.oldest_sequence() if from_start else self._next_sequence
+        return Subscriber(self, start)
+
+    def _read(self, start: int, stop: int):
+        """Returns the buffered events with sequence numbers in [start, stop)."""
+        return [self._buffer[sequence % self.capacity] for sequence in range(start, stop)]
+
+
+class Subscriber:
+    """
+    Reads events from a change log in batches using its own cursor.
+
+    Attributes:
+        cursor (int): The sequence number of the next event to read.
+        missed (int): How many events were overwritten before this
+                      subscriber could read them.
+    """
+
+    def __init__(self, change_log: ChangeLog, cursor: int):
+        """
+        Initializes a subscriber.
+
+        Args:
+            change_log (ChangeLog): The log to read from.
+            cursor (int): The sequence number of the first event to read.
+        """
+        self.change_log = change_log
+        self.cursor = cursor
+        self.missed = 0
+
+    def pending(self) -> int:
+        """Returns how many events are waiting to be read."""
+        return self.change_log.next_sequence() - max(self.cursor, self.change_log.oldest_sequence())
+
+    def poll(self, max_events: int = 100, coalesce: bool = True):
+        """
+        Reads the next batch of events and advances the cursor.
+
+        When coalescing, repeated changes to the same field of the same
+        product within the batch are merged into one event carrying the
+        first old value and the last new value; changes that cancel out
+        are dropped. A product that ends the batch unlisted is reported
+        only by its unlisting, if it was listed before the batch.
+
+        Args:
+            max_events (int): The maximum number of log entries to consume.
+            coalesce (bool): Whether to merge repeated changes.
+
+        Returns:
+            list: The change events, in log order.
+
+        Raises:
+            ValueError: If max_events is not positive.
+        """
+        if max_events <= 0:
+            raise ValueError(f"{RED}ATTENTION! Batch size must be positive.{RESET}")
+        oldest = self.change_log.oldest_sequence()
+        if self.cursor < oldest:
+            self.missed += oldest - self.cursor
+            self.cursor = oldest
+        stop = min(self.cursor + max_events, self.change_log.next_sequence())
+        events = self.change_log._read(self.cursor, stop)
+        self.cursor = stop
+        if not coalesce:
+            return events
+
+        merged = {}
+        for event in events:
+            key = (id(event.product), event.field)
+            first = merged.pop(key, event)
+            merged[key] = ChangeEvent(event.sequence, event.product, event.field,
+                                      first.old_value, event.new_value)
+        coalesced = []
+        for event in merged.values():
+            listing = merged.get((id(event.product), "listed"))
+            if listing is not None and not listing.new_value and event.field != "listed":
+                continue
+            if event.old_value != event.new_value:
+                coalesced.append(event)
+        return coalesced
@@ -13,6 +13,7 @@ class Product:
         price (float): The price per unit (must be positive).
         quantity (int): How many items are in stock (zero or higher).
         active (bool): Indicates if the product is still for sale.
+        change_logs (list): The change logs of the stores listing this product.
     """
     def __init__(self, name: str, price: float, quantity: int):
         """
@@ -34,6 +35,13 @@ class Product:
         self.quantity = quantity
         self.active = True
         self.promotion = None
+        self.change_logs = []
+
+    def _record_change(self, field: str, old_value, new_value):
+        """Records a change in every attached change log."""
+        if old_value != new_value:
+            for change_log in self.change_logs:
+                change_log.record(self, field, old_value, new_value)
 
     def get_quantity(self) -> float:
         """Returns the number of items in stock."""
@@ -51,7 +59,9 @@ class Product:
         """
         if quantity < 0:
             raise ValueError(f"{RED}ATTENTION! Quantity can't be negative.{RESET}")
+        old_quantity = self.quantity
         self.quantity = quantity
+        self._record_change("quantity", old_quantity, quantity)
         if self.quantity == 0:
             self.deactivate()
 
@@ -61,10 +71,12 @@ class Product:
 
     def activate(self):
         """Marks the product as active."""
+        self._record_change("active", self.active, True)
         self.active = True
 
     def deactivate(self):
         """Marks the product as inactive (out of stock or discontinued)."""
+        self._record_change("active", self.active, False)
         self.active = False
 
     def set_promotion(self, promotion):
@@ -74,6 +86,7 @@ class Product:
         Args:
             promotion (Promotion): The promotion to assign.
         """
+        self._record_change("promotion", self.promotion, promotion)
         self.promotion = promotion
 
     def get_promotion(self):
@@ -1,3 +1,5 @@
+from changes import ChangeLog
+
 RED = "\033[91m"
 YELLOW = "\033[93m"
 CYAN = "\033[96m"
@@ -9,16 +11,19 @@ class Store:
     A class representing a store that has multiple products.
     """
 
-    def __init__(self, products):
+    def __init__(self, products, change_log_capacity: int = 1024):
         """
         Initializes the store with a list of products.
 
         Args:
             products: The list of products to initialize the store with.
+            change_log_capacity: How many change events the store keeps
+                                 for subscribers.
         """
         self.products = []
+        self.change_log = ChangeLog(change_log_capacity)
         for product in products:
-            self.products.append(product)
+            self.add_product(product)
 
     def add_product(self, product):
         """
@@ -27,7 +32,11 @@ class Store:
         Args:
             product: The product to be added to the store.
         """
+        listed = product in self.products
         self.products.append(product)
+        if not listed:
+            product.change_logs.append(self.change_log)
+            self.change_log.record(product, "listed", False, True)
 
     def remove_product(self, product):
         """
@@ -37,6 +46,21 @@ class Store:
             product: The product to be removed from the inventory.
         """
         self.products.remove(product)
+        if product not in self.products:
+            self.change_log.record(product, "listed", True, False)
+            product.change_logs.remove(self.change_log)
+
+    def subscribe(self, from_start: bool = False):
+        """
+        Subscribes to product changes in the store.
+
+        Args:
+            from_start: If True, also deliver the changes still kept in the log.
+
+        Returns:
+            A subscriber that reads change events in batches.
+        """
+        return self.change_log.subscribe(from_start)
 
     def get_total_quantity(self) -> int:
         """
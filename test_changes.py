@@ -0,0 +1,226 @@
+import pytest
+import promotions
+from products import Product
+from store import Store
+
+
+def test_store_changes_are_delivered_to_subscriber():
+    """Tests stock, active flag and promotion changes reach a subscriber."""
+    macbook = Product("MacBook Air M2", price=1450, quantity=1)
+    best_buy = Store([macbook])
+    subscriber = best_buy.subscribe()
+
+    macbook.set_promotion(promotions.ThirdOneFree("Third One Free!"))
+    best_buy.order([(macbook, 1)])
+
+    fields = [event.field for event in subscriber.poll()]
+    assert fields == ["promotion", "quantity", "active"]
+
+
+def test_repeated_updates_are_coalesced():
+    """Tests repeated quantity changes to one product merge into one event."""
+    earbuds = Product("Bose QuietComfort Earbuds", price=250, quantity=500)
+    best_buy = Store([earbuds])
+    subscriber = best_buy.subscribe()
+
+    earbuds.buy(1)
+    earbuds.buy(2)
+    earbuds.set_quantity(100)
+
+    events = subscriber.poll()
+    assert len(events) == 1
+    assert events[0].old_value == 500
+    assert events[0].new_value == 100
+
+
+def test_add_and_remove_product_are_recorded():
+    """Tests listing changes are recorded and removed products stop emitting."""
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    best_buy = Store([])
+    subscriber = best_buy.subscribe()
+
+    best_buy.add_product(pixel)
+    best_buy.remove_product(pixel)
+    pixel.set_quantity(10)
+
+    events = subscriber.poll(coalesce=False)
+    assert [(event.field, event.new_value) for event in events] == [("listed", True),
+                                                                     ("listed", False)]
+
+
+def test_slow_subscriber_skips_overwritten_events():
+    """Tests a full buffer overwrites old events instead of blocking."""
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    best_buy = Store([macbook], change_log_capacity=3)
+    subscriber = best_buy.subscribe()
+
+    for quantity in range(90, 95):
+        macbook.set_quantity(quantity)
+
+    events = subscriber.poll(coalesce=False)
+    assert subscriber.missed == 2
+    assert [event.new_value for event in events] == [92, 93, 94]
+    assert subscriber.pending() == 0
+
+
+def test_poll_in_batches():
+    """Tests a subscriber reads the log in batches of the requested size."""
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    best_buy = Store([macbook])
+    subscriber = best_buy.subscribe()
+
+    for quantity in range(90, 95):
+        macbook.set_quantity(quantity)
+
+    assert len(subscriber.poll(max_events=2, coalesce=False)) == 2
+    assert subscriber.pending() == 3
+    with pytest.raises(ValueError):
+        subscriber.poll(max_events=0)
+
+
+def test_changes_that_cancel_out_are_dropped():
+    """Tests coalescing drops events whose old and new values end up equal."""
+    macbook = Product("MacBook Air M2", price=1450, quantity=5)
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    best_buy = Store([macbook])
+    subscriber = best_buy.subscribe()
+
+    macbook.buy(5)
+    macbook.set_quantity(5)
+    macbook.activate()
+    best_buy.add_product(pixel)
+    best_buy.remove_product(pixel)
+
+    assert subscriber.poll() == []
+
+
+def test_product_added_updated_and_removed_in_one_batch_is_dropped():
+    """Tests a product listed and unlisted within a batch reports nothing."""
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    best_buy = Store([])
+    subscriber = best_buy.subscribe()
+
+    best_buy.add_product(pixel)
+    pixel.set_quantity(10)
+    best_buy.remove_product(pixel)
+
+    assert subscriber.poll() == []
+
+
+def test_removed_product_reports_only_its_unlisting():
+    """Tests changes before removal are folded into the unlisting event."""
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    best_buy = Store([pixel])
+    subscriber = best_buy.subscribe()
+
+    pixel.set_quantity(10)
+    pixel.deactivate()
+    best_buy.remove_product(pixel)
+
+    events = subscriber.poll()
+    assert [(event.field, event.new_value) for event in events] == [("listed", False)]
+
+
+def test_relisted_product_keeps_its_changes():
+    """Tests a product removed and re-added within a batch still reports its updates."""
+    pixel = Product("Google Pixel 7", price=500, quantity=250)
+    best_buy = Store([pixel])
+    subscriber = best_buy.subscribe()
+
+    best_buy.remove_product(pixel)
+    best_buy.add_product(pixel)
+    pixel.set_quantity(10)
+
+    events = subscriber.poll()
+    assert [(event.field, event.new_value) for event in events] == [("quantity", 10)]
+
+
+def test_product_listed_in_several_stores_notifies_each():
+    """Tests a product shared by two stores records changes in both logs."""
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    best_buy = Store([macbook])
+    other_store = Store([macbook])
+    best_buy_subscriber = best_buy.subscribe()
+    other_subscriber = other_store.subscribe()
+
+    macbook.set_quantity(50)
+    other_store.remove_product(macbook)
+    macbook.set_quantity(10)
+
+    assert [(event.field, event.new_value) for event in best_buy_subscriber.poll(coalesce=False)] == [
+        ("quantity", 50), ("quantity", 10)]
+    assert [(event.field, event.new_value) for event in other_subscriber.poll(coalesce=False)] == [
+        ("quantity", 50), ("listed", False)]
+    assert macbook.change_logs == [best_buy.change_log]
+
+
+def test_store_can_open_with_products_from_other_stores():
+    """Tests opening a store with an already listed product attaches every product."""
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    earbuds = Product("Bose QuietComfort Earbuds", price=250, quantity=500)
+    Store([earbuds])
+    best_buy = Store([macbook, earbuds])
+    other_store = Store([macbook])
+
+    assert macbook.change_logs == [best_buy.change_log, other_store.change_log]
+    assert best_buy.change_log in earbuds.change_logs
+
+
+def test_product_listed_twice_keeps_recording_until_fully_removed():
+    """Tests removing one of two listings keeps the product in the change log."""
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    best_buy = Store([macbook, macbook])
+    subscriber = best_buy.subscribe()
+
+    best_buy.remove_product(macbook)
+    macbook.set_quantity(50)
+    best_buy.remove_product(macbook)
+    macbook.set_quantity(10)
+
+    events = subscriber.poll(coalesce=False)
+    assert [(event.field, event.new_value) for event in events] == [("quantity", 50),
+                                                                     ("listed", False)]
+
+
+def test_subscribe_from_start_replays_initial_listing():
+    """Tests a subscriber created from the start sees the products the store opened with."""
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    earbuds = Product("Bose QuietComfort Earbuds", price=250, quantity=500)
+    best_buy = Store([macbook, earbuds])
+
+    assert best_buy.subscribe().pending() == 0
+    subscriber = best_buy.subscribe(from_start=True)
+    assert subscriber.cursor == 0
+    assert subscriber.pending() == 2
+
+    events = subscriber.poll()
+    assert [(event.product, event.field, event.new_value) for event in events] == [
+        (macbook, "listed", True), (earbuds, "listed", True)]
+    assert subscriber.missed == 0
+
+
+def test_subscriber_falls_behind_again_between_batches():
+    """Tests missed and pending when the buffer wraps past a partly read subscriber."""
+    macbook = Product("MacBook Air M2", price=1450, quantity=100)
+    best_buy = Store([macbook], change_log_capacity=4)
+    subscriber = best_buy.subscribe()
+
+    for quantity in range(90, 96):
+        macbook.set_quantity(quantity)
+    assert best_buy.change_log.oldest_sequence() == 3
+    assert subscriber.pending() == 4
+
+    events = subscriber.poll(max_events=2, coalesce=False)
+    assert [event.new_value for event in events] == [92, 93]
+    assert subscriber.missed == 2
+    assert subscriber.pending() == 2
+
+    for quantity in range(96, 99):
+        macbook.set_quantity(quantity)
+    assert best_buy.change_log.oldest_sequence() == 6
+    assert subscriber.pending() == 4
+
+    events = subscriber.poll(max_events=2, coalesce=False)
+    assert [event.new_value for event in events] == [95, 96]
+    assert subscriber.missed == 3
+    assert subscriber.pending() == 2